@@ -1,9 +1,17 @@
 from collections import OrderedDict
 
+import torch
+
 from adept.actor import ActorModule
 from adept.actor.base.ac_helper import ACActorHelperMixin
 
 
+@torch.jit.script
+def _select_action(logit: torch.Tensor) -> torch.Tensor:
+    # softmax is monotonic, so the greedy action is the argmax of the logits
+    return torch.argmax(logit.flatten(1), dim=1)
+
+
 class ACActorEval(ActorModule, ACActorHelperMixin):
     args = {}
 
@@ -20,11 +28,7 @@ class ACActorEval(ActorModule, ACActorHelperMixin):
         actions = OrderedDict()
 
         for key in self.action_keys:
-            logit = self.flatten_logits(preds[key])
-
-            softmax = self.softmax(logit)
-            action = self.select_action(softmax)
-
+            action = _select_action(preds[key])
             actions[key] = action.cpu()
         return actions, {"value": preds["critic"].squeeze(-1)}
 
@@ -40,10 +44,8 @@ class ACActorEvalSample(ACActorEval):
         actions = OrderedDict()
 
         for key in self.action_keys:
-            logit = self.flatten_logits(preds[key])
-
-            softmax = self.softmax(logit)
-            action = self.sample_action(softmax)
-
+            action = self.sample_action_from_logit(
+                self.flatten_logits(preds[key])
+            )
             actions[key] = action.cpu()
         return actions, {"value": preds["critic"].squeeze(-1)}
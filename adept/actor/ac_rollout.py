@@ -42,12 +42,10 @@ class ACRolloutActorTrain(ActorModule, ACActorHelperMixin):
         for key in self.action_keys:
             logit = self.flatten_logits(preds[key])
 
-            log_softmax, softmax = self.log_softmax(logit), self.softmax(logit)
-            entropy = self.entropy(log_softmax, softmax)
-            action = self.sample_action(softmax)
+            action, log_prob, entropy = self.sample_action_with_stats(logit)
 
             entropies.append(entropy)
-            log_probs.append(self.log_probability(log_softmax, action))
+            log_probs.append(log_prob)
             actions[key] = action.cpu()
 
         log_probs = torch.cat(log_probs, dim=1)
@@ -1,8 +1,28 @@
 import abc
+from typing import Tuple
+
 import torch
 from torch.nn import functional as F
 
 
+@torch.jit.script
+def _sample_action_with_stats(
+    logit: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    log_softmax = F.log_softmax(logit, dim=1)
+    softmax = log_softmax.exp()
+    action = softmax.multinomial(1)
+    log_prob = log_softmax.gather(1, action)
+    entropy = -(log_softmax * softmax).sum(1, keepdim=True)
+    return action.squeeze(1), log_prob, entropy
+
+
+@torch.jit.script
+def _sample_action_from_logit(logit: torch.Tensor) -> torch.Tensor:
+    softmax = F.softmax(logit, dim=1)
+    return softmax.multinomial(1).squeeze(1)
+
+
 class ACActorHelperMixin(metaclass=abc.ABCMeta):
     """
     A helper class for actor critic actors.
@@ -72,6 +92,27 @@ class ACActorHelperMixin(metaclass=abc.ABCMeta):
         """
         return softmax.multinomial(1).squeeze(1)
 
+    @staticmethod
+    def sample_action_from_logit(logit):
+        """
+        Samples an action from the softmax of the logits in one scripted call.
+
+        :param logit: torch.Tensor (N, X)
+        :return: torch.Tensor (N)
+        """
+        return _sample_action_from_logit(logit)
+
+    @staticmethod
+    def sample_action_with_stats(logit):
+        """
+        Samples an action from the logits and computes its log probability
+        and the policy entropy in one scripted call.
+
+        :param logit: torch.Tensor (N, X)
+        :return: Tuple[LongTensor (N), Tensor (N, 1), Tensor (N, 1)]
+        """
+        return _sample_action_with_stats(logit)
+
     @staticmethod
     def select_action(softmax):
         """
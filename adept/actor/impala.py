@@ -122,10 +122,9 @@ class ImpalaWorkerActor(ActorModule, ACActorHelperMixin):
         for key in self.action_keys:
             logit = self.flatten_logits(preds[key])
 
-            log_softmax, softmax = self.log_softmax(logit), self.softmax(logit)
-            action = self.sample_action(softmax)
+            action, log_prob, _ = self.sample_action_with_stats(logit)
 
-            log_probs.append(self.log_probability(log_softmax, action))
+            log_probs.append(log_prob)
             actions_gpu[key] = action
             actions_cpu[key] = action.cpu()
 
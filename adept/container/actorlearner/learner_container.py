@@ -53,6 +53,7 @@ class ActorLearnerHost(Container):
     def __init__(
         self, args, log_id_dir, initial_step_count, rank=0,
     ):
+        super().__init__()
         # ARGS TO STATE VARS
         self._args = args
         self.nb_learners = args.nb_learners
@@ -24,7 +24,7 @@ from adept.network import ModularNetwork
 from adept.registry import REGISTRY
 from adept.utils.util import dtensor_to_dev, listd_to_dlist
 
-from adept.container.base import Container
+from adept.container.base import Container, RewardCounter
 
 
 class ActorLearnerWorker(Container):
@@ -48,6 +48,7 @@ class ActorLearnerWorker(Container):
         )(cls)
 
     def __init__(self, args, log_id_dir, initial_step_count, rank):
+        super().__init__()
         seed = args.seed if rank == 0 else args.seed + args.nb_env * rank
         print("Worker {} using seed {}".format(rank, seed))
 
@@ -102,15 +103,12 @@ class ActorLearnerWorker(Container):
         # SETUP state variables for run
         self.step_count = self.initial_step_count
         self.global_step_count = self.initial_step_count
-        self.ep_rewards = torch.zeros(self.nb_env)
+        self.reward_counter = RewardCounter(self.nb_env)
         self.rank = rank
 
         self.obs = dtensor_to_dev(self.env_mgr.reset(), self.device)
-        self.internals = listd_to_dlist(
-            [
-                self.network.new_internals(self.device)
-                for _ in range(self.nb_env)
-            ]
+        self.internals = self.network.new_internals_batched(
+            self.device, self.nb_env
         )
         self.start_time = time()
         self._weights_synced = False
@@ -140,26 +138,24 @@ class ActorLearnerWorker(Container):
 
             # Perform state updates
             self.step_count += self.nb_env
-            self.ep_rewards += rewards.float()
             self.obs = next_obs
 
-            term_rewards = []
             for i, terminal in enumerate(terminals):
                 if terminal:
                     for k, v in self.network.new_internals(self.device).items():
                         self.internals[k][i] = v
-                    rew = self.ep_rewards[i].item()
-                    term_rewards.append(rew)
-                    self.ep_rewards[i].zero_()
-
-                    for k, v in infos[i].items():
-                        if k not in all_terminal_infos:
-                            all_terminal_infos[k] = []
-                        all_terminal_infos[k].append(v)
+            term_rewards, term_infos = self.reward_counter.update_buffers(
+                rewards, terminals, infos
+            )
+            for info in term_infos:
+                for k, v in info.items():
+                    if k not in all_terminal_infos:
+                        all_terminal_infos[k] = []
+                    all_terminal_infos[k].append(v)
 
             # avg rewards
             if term_rewards:
-                term_reward = np.mean(term_rewards)
+                term_reward = sum(term_rewards) / len(term_rewards)
                 all_terminal_rewards.append(term_reward)
 
                 delta_t = time() - self.start_time
@@ -1,2 +1,3 @@
 from .container import Container
 from .nccl_optimizer import NCCLOptimizer
+from .reward_counter import RewardCounter
@@ -2,6 +2,13 @@ import torch
 
 
 class Container:
+    # parameter norms are only written every this many summary calls
+    param_summary_freq = 10
+
+    def __init__(self):
+        # number of write_summaries calls made by this container
+        self._nb_summary = 0
+
     @staticmethod
     def load_network(network, path):
         network.load_state_dict(
@@ -18,29 +25,47 @@ class Container:
 
     @staticmethod
     def init_next_save(initial_step_count, epoch_len):
-        next_save = 0
         if initial_step_count > 0:
-            while next_save <= initial_step_count:
-                next_save += epoch_len
-        return next_save
+            # first multiple of epoch_len past the initial step count
+            return (initial_step_count // epoch_len + 1) * epoch_len
+        return 0
 
     @staticmethod
     def count_parameters(net):
         return sum(p.numel() for p in net.parameters() if p.requires_grad)
 
-    @staticmethod
     def write_summaries(
-        writer, step_count, total_loss, loss_dict, metric_dict, n_params
+        self, writer, step_count, total_loss, loss_dict, metric_dict, n_params
     ):
-        writer.add_scalar("loss/total_loss", total_loss.item(), step_count)
-        for l_name, loss in loss_dict.items():
-            writer.add_scalar("loss/" + l_name, loss.item(), step_count)
-        for m_name, metric in metric_dict.items():
-            writer.add_scalar("metric/" + m_name, metric.item(), step_count)
+        # losses and metrics are moved to the host together in one sync
+        names = ["loss/total_loss"]
+        names += ["loss/" + l_name for l_name in loss_dict.keys()]
+        names += ["metric/" + m_name for m_name in metric_dict.keys()]
+        scalars = [total_loss, *loss_dict.values(), *metric_dict.values()]
+        values = torch.stack(
+            [t.detach().float().reshape(()) for t in scalars]
+        ).tolist()
+        for name, value in zip(names, values):
+            writer.add_scalar(name, value, step_count)
+
+        write_params = self._nb_summary % self.param_summary_freq == 0
+        self._nb_summary += 1
+        if not write_params:
+            return
+
+        # compute every norm in one batched op and move them over in one sync
+        p_names, params = [], []
+        g_names, grads = [], []
         for p_name, param in n_params:
             p_name = p_name.replace(".", "/")
-            writer.add_scalar(p_name, torch.norm(param).item(), step_count)
+            p_names.append(p_name)
+            params.append(param.detach())
             if param.grad is not None:
-                writer.add_scalar(
-                    p_name + ".grad", torch.norm(param.grad).item(), step_count
-                )
+                g_names.append(p_name + ".grad")
+                grads.append(param.grad.detach())
+        for names, tensors in ((p_names, params), (g_names, grads)):
+            if not tensors:
+                continue
+            norms = torch.stack(torch._foreach_norm(tensors)).tolist()
+            for name, norm in zip(names, norms):
+                writer.add_scalar(name, norm, step_count)
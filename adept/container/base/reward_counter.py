@@ -0,0 +1,57 @@
+# Copyright (C) 2018 Heron Systems, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numpy as np
+import torch
+
+
+class RewardCounter:
+    """
+    Accumulates per-environment episode rewards and reports the totals of the
+    episodes that finish on each step.
+    """
+
+    def __init__(self, nb_env):
+        self.nb_env = nb_env
+        self.episode_reward_buffer = torch.zeros(nb_env)
+
+    def update_buffers(self, rewards, terminals, infos):
+        """
+        Add one step of rewards and collect the finished episodes.
+
+        :param rewards: Tensor or ndarray of shape (nb_env,)
+        :param terminals: Tensor or ndarray of shape (nb_env,)
+        :param infos: Tuple[Dict]
+        :return: Tuple[List[float], List[Dict]], the reward totals of finished
+        episodes and the non-empty infos of finished episodes.
+        """
+        # add in place straight from the env output, numpy is wrapped
+        # without a copy
+        if not isinstance(rewards, torch.Tensor):
+            rewards = torch.from_numpy(np.asarray(rewards, dtype=np.float32))
+        self.episode_reward_buffer.add_(rewards)
+
+        # most steps finish no episode, and infos only need checking for the
+        # ones that do
+        done_idx = np.flatnonzero(np.asarray(terminals))
+        if done_idx.size == 0:
+            return [], []
+        done_t = torch.from_numpy(done_idx)
+        terminal_rewards = self.episode_reward_buffer[done_t].tolist()
+        self.episode_reward_buffer.index_fill_(0, done_t, 0.0)
+        # filter(None, ...) tests info truthiness in C
+        terminal_infos = list(
+            filter(None, map(infos.__getitem__, done_idx.tolist()))
+        )
+        return terminal_rewards, terminal_infos
@@ -1,5 +1,4 @@
 # Copyright (C) 2020 Heron Systems, Inc.
-import numpy as np
 import os
 import torch
 import torch.distributed as dist
@@ -10,9 +9,9 @@ from torch.utils.tensorboard import SummaryWriter
 from adept.manager import SubProcEnvManager
 from adept.network import ModularNetwork
 from adept.registry import REGISTRY
-from adept.utils import dtensor_to_dev, listd_to_dlist
+from adept.utils import dtensor_to_dev
 from adept.utils.logging import SimpleModelSaver
-from .base import Container
+from .base import Container, RewardCounter
 from .base.updater import Updater
 
 
@@ -60,6 +59,7 @@ class DistribHost(Container):
         global_rank,
         world_size,
     ):
+        super().__init__()
         seed = (
             args.seed
             if global_rank == 0
@@ -150,15 +150,10 @@ class DistribHost(Container):
         local_step_count = global_step_count = self.initial_step_count
         next_save = self.init_next_save(self.initial_step_count, self.epoch_len)
         prev_step_t = time()
-        ep_rewards = torch.zeros(self.nb_env)
+        reward_counter = RewardCounter(self.nb_env)
 
         obs = dtensor_to_dev(self.env_mgr.reset(), self.device)
-        internals = listd_to_dlist(
-            [
-                self.network.new_internals(self.device)
-                for _ in range(self.nb_env)
-            ]
-        )
+        internals = self.network.new_internals_batched(self.device, self.nb_env)
         start_time = time()
         while global_step_count < self.nb_step:
             actions, internals = self.agent.act(self.network, obs, internals)
@@ -179,19 +174,14 @@ class DistribHost(Container):
             # Perform state updates
             local_step_count += self.nb_env
             global_step_count += self.nb_env * self.world_size
-            ep_rewards += rewards.float()
             obs = next_obs
 
-            term_rewards = []
-            for i, terminal in enumerate(terminals):
-                if terminal:
-                    for k, v in self.network.new_internals(self.device).items():
-                        internals[k][i] = v
-                    term_rewards.append(ep_rewards[i].item())
-                    ep_rewards[i].zero_()
+            term_rewards, _ = reward_counter.update_buffers(
+                rewards, terminals, infos
+            )
 
             if term_rewards:
-                term_reward = np.mean(term_rewards)
+                term_reward = sum(term_rewards) / len(term_rewards)
                 delta_t = time() - start_time
                 self.logger.info(
                     "RANK: {} "
@@ -262,6 +252,7 @@ class DistribWorker(Container):
         global_rank,
         world_size,
     ):
+        super().__init__()
         seed = (
             args.seed
             if global_rank == 0
@@ -344,15 +335,10 @@ class DistribWorker(Container):
 
     def run(self):
         local_step_count = global_step_count = self.initial_step_count
-        ep_rewards = torch.zeros(self.nb_env)
+        reward_counter = RewardCounter(self.nb_env)
 
         obs = dtensor_to_dev(self.env_mgr.reset(), self.device)
-        internals = listd_to_dlist(
-            [
-                self.network.new_internals(self.device)
-                for _ in range(self.nb_env)
-            ]
-        )
+        internals = self.network.new_internals_batched(self.device, self.nb_env)
         start_time = time()
         while global_step_count < self.nb_step:
             actions, internals = self.agent.act(self.network, obs, internals)
@@ -373,19 +359,14 @@ class DistribWorker(Container):
             # Perform state updates
             local_step_count += self.nb_env
             global_step_count += self.nb_env * self.world_size
-            ep_rewards += rewards.float()
             obs = next_obs
 
-            term_rewards = []
-            for i, terminal in enumerate(terminals):
-                if terminal:
-                    for k, v in self.network.new_internals(self.device).items():
-                        internals[k][i] = v
-                    term_rewards.append(ep_rewards[i].item())
-                    ep_rewards[i].zero_()
+            term_rewards, _ = reward_counter.update_buffers(
+                rewards, terminals, infos
+            )
 
             if term_rewards:
-                term_reward = np.mean(term_rewards)
+                term_reward = sum(term_rewards) / len(term_rewards)
                 delta_t = time() - start_time
                 self.logger.info(
                     "RANK: {} "
@@ -13,14 +13,29 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 import os
+from contextlib import nullcontext
+from functools import partial
 
+import numpy as np
 import torch
 
 from adept.manager import SubProcEnvManager
 from adept.network import ModularNetwork
 from adept.registry import REGISTRY
 from adept.utils.script_helpers import LogDirHelper
-from adept.utils.util import listd_to_dlist, dtensor_to_dev
+from adept.utils.util import dtensor_to_dev
+
+
+def _compile_errors():
+    # only tracing and backend failures fall back to eager, runtime errors
+    # such as OOM or shape mismatches still raise
+    from torch._dynamo import exc
+
+    return (
+        exc.BackendCompilerFailed,
+        exc.Unsupported,
+        exc.InternalTorchDynamoError,
+    )
 
 
 class EvalContainer:
@@ -35,11 +50,13 @@ class EvalContainer:
         start,
         end,
         seed,
+        compile_step=False,
     ):
         self.log_dir_helper = log_dir_helper = LogDirHelper(log_id_dir)
         self.train_args = train_args = log_dir_helper.load_args()
         self.device = device = self._device_from_gpu_id(gpu_id)
         self.logger = logger
+        self.compile_step = compile_step
 
         if epoch_id:
             epoch_ids = [epoch_id]
@@ -73,6 +90,38 @@ class EvalContainer:
             output_space,
             REGISTRY,
         ).to(device)
+        self._init_eval_state()
+
+    def _init_eval_state(self):
+        device = self.device
+        # no backward pass during eval, run conv layers in half precision
+        self._use_amp = device.type == "cuda"
+
+        # obs buffers are allocated from the first observation
+        self._obs_host = None
+        self._obs_dev = None
+        if device.type == "cuda":
+            self._copy_stream = torch.cuda.Stream(device)
+        else:
+            self._copy_stream = None
+
+        self._reward_buf = torch.zeros(self.env_mgr.nb_env)
+        self._done_mask = np.zeros(self.env_mgr.nb_env, dtype=np.bool_)
+        self._all_done = False
+
+        # obs and internal shapes are fixed during eval, so the step can be
+        # captured into CUDA graphs. Opt-in, falls back to eager if capture
+        # fails.
+        if (
+            self.compile_step
+            and device.type == "cuda"
+            and hasattr(torch, "compile")
+        ):
+            self._compiled_act = torch.compile(
+                self.actor.act, mode="reduce-overhead"
+            )
+        else:
+            self._compiled_act = None
 
     @staticmethod
     def _device_from_gpu_id(gpu_id):
@@ -96,68 +145,29 @@ class EvalContainer:
         )
 
     def run(self):
-        nb_env = self.env_mgr.nb_env
         best_epoch_id = None
         overall_mean = -float("inf")
-        for epoch_id in self.epoch_ids:
-            best_mean = -float("inf")
-            best_std = None
-            selected_model = None
-            reward_buf = torch.zeros(nb_env)
-            for net_path in self.log_dir_helper.network_paths_at_epoch(
-                epoch_id
-            ):
-                self.network.load_state_dict(
-                    torch.load(
-                        net_path, map_location=lambda storage, loc: storage
-                    )
-                )
-                self.network.eval()
+        # line buffered, each epoch's result is on disk once it's written
+        with open(self.log_dir_helper.eval_path(), "a", buffering=1) as eval_f:
+            for epoch_id in self.epoch_ids:
+                best_mean = -float("inf")
+                best_std = None
+                selected_model = None
+                for net_path in self.log_dir_helper.network_paths_at_epoch(
+                    epoch_id
+                ):
+                    mean, std = self._evaluate(net_path)
+                    if mean >= best_mean:
+                        best_mean = mean
+                        best_std = std
+                        selected_model = os.path.split(net_path)[-1]
 
-                internals = listd_to_dlist(
-                    [
-                        self.network.new_internals(self.device)
-                        for _ in range(nb_env)
-                    ]
+                self.logger.info(
+                    f"EPOCH_ID: {epoch_id} "
+                    f"MEAN_REWARD: {best_mean} "
+                    f"STD_DEV: {best_std} "
+                    f"SELECTED_MODEL: {selected_model}"
                 )
-                episode_completes = [False for _ in range(nb_env)]
-                next_obs = dtensor_to_dev(self.env_mgr.reset(), self.device)
-
-                while not all(episode_completes):
-                    obs = next_obs
-                    with torch.no_grad():
-                        actions, _, internals = self.actor.act(
-                            self.network, obs, internals
-                        )
-                    next_obs, rewards, terminals, infos = self.env_mgr.step(
-                        actions
-                    )
-                    next_obs = dtensor_to_dev(next_obs, self.device)
-
-                    for i in range(self.env_mgr.nb_env):
-                        if episode_completes[i]:
-                            continue
-                        elif terminals[i]:
-                            reward_buf[i] += rewards[i]
-                            episode_completes[i] = True
-                        else:
-                            reward_buf[i] += rewards[i]
-
-                mean = reward_buf.mean().item()
-                std = reward_buf.std().item()
-
-                if mean >= best_mean:
-                    best_mean = mean
-                    best_std = std
-                    selected_model = os.path.split(net_path)[-1]
-
-            self.logger.info(
-                f"EPOCH_ID: {epoch_id} "
-                f"MEAN_REWARD: {best_mean} "
-                f"STD_DEV: {best_std} "
-                f"SELECTED_MODEL: {selected_model}"
-            )
-            with open(self.log_dir_helper.eval_path(), "a") as eval_f:
                 eval_f.write(
                     f"{epoch_id},"
                     f"{best_mean},"
@@ -165,12 +175,100 @@ class EvalContainer:
                     f"{selected_model}\n"
                 )
 
-            if best_mean >= overall_mean:
-                best_epoch_id = epoch_id
-                overall_mean = best_mean
+                if best_mean >= overall_mean:
+                    best_epoch_id = epoch_id
+                    overall_mean = best_mean
         self.logger.info(
             f"*** EPOCH_ID: {best_epoch_id} MEAN_REWARD: {overall_mean} ***"
         )
 
+    def _evaluate(self, net_path):
+        self._load_network(net_path)
+        self.network.eval()
+
+        internals = self.network.new_internals_batched(
+            self.device, self.env_mgr.nb_env
+        )
+        self._reward_buf.zero_()
+        self._done_mask[:] = False
+        self._all_done = False
+        # bind hot lookups once, the loop runs for every env step
+        act, network = self._act, self.network
+        step, obs_to_dev = self.env_mgr.step, self._obs_to_dev
+        update_rewards = self._update_rewards
+        # torch < 1.13 warns about float16 autocast on cpu even when disabled
+        if self._use_amp:
+            autocast = partial(torch.autocast, self.device.type, torch.float16)
+        else:
+            autocast = nullcontext
+
+        obs = self.env_mgr.reset()
+        while not self._all_done:
+            with torch.inference_mode(), autocast():
+                actions, _, internals = act(
+                    network, obs_to_dev(obs), internals
+                )
+            obs, rewards, terminals, _ = step(actions)
+            update_rewards(rewards, terminals)
+
+        return self._reward_buf.mean().item(), self._reward_buf.std().item()
+
+    def _act(self, network, obs, internals):
+        if self._compiled_act is not None:
+            try:
+                return self._compiled_act(network, obs, internals)
+            except _compile_errors() as e:
+                self.logger.warning(
+                    f"Compiled eval step failed, running eagerly: {e}"
+                )
+                self._compiled_act = None
+        return self.actor.act(network, obs, internals)
+
+    def _load_network(self, net_path):
+        # load straight onto the device, no host copy of the checkpoint
+        self.network.load_state_dict(
+            torch.load(net_path, map_location=self.device)
+        )
+
+    def _obs_to_dev(self, obs):
+        if self._copy_stream is None:
+            return dtensor_to_dev(obs, self.device)
+        # obs shapes are fixed by the env, buffers are only (re)allocated
+        # on the first step or if the env hands back something new
+        if self._obs_host is None or any(
+            k not in self._obs_host or self._obs_host[k].shape != v.shape
+            for k, v in obs.items()
+        ):
+            self._obs_host = {
+                k: torch.empty_like(v).pin_memory() for k, v in obs.items()
+            }
+            self._obs_dev = {
+                k: torch.empty_like(v, device=self.device)
+                for k, v in obs.items()
+            }
+
+        # stage through pinned memory so the upload runs on the copy stream,
+        # after the previous forward pass is done reading the device buffers
+        cur_stream = torch.cuda.current_stream(self.device)
+        self._copy_stream.wait_stream(cur_stream)
+        with torch.cuda.stream(self._copy_stream):
+            for k, v in obs.items():
+                self._obs_host[k].copy_(v)
+                self._obs_dev[k].copy_(self._obs_host[k], non_blocking=True)
+        cur_stream.wait_stream(self._copy_stream)
+        return dict(self._obs_dev)
+
+    def _update_rewards(self, rewards, terminals):
+        # only count rewards of episodes that are still running
+        rewards = torch.as_tensor(rewards, dtype=torch.float32)
+        self._reward_buf.add_(
+            rewards.masked_fill(torch.from_numpy(self._done_mask), 0.0)
+        )
+        # the completion check only needs redoing when an episode ends
+        terminals = np.asarray(terminals, dtype=np.bool_)
+        if terminals.any():
+            self._done_mask |= terminals
+            self._all_done = self._done_mask.all()
+
     def close(self):
         self.env_mgr.close()
@@ -9,7 +9,7 @@ from adept.network import ModularNetwork
 from adept.registry import REGISTRY
 from adept.utils.logging import SimpleModelSaver
 from adept.utils.util import dtensor_to_dev, listd_to_dlist
-from .base import Container
+from .base import Container, RewardCounter
 from .base.updater import Updater
 
 
@@ -24,6 +24,7 @@ class LocalUpdater(Updater):
 
 class Local(Container):
     def __init__(self, args, logger, log_id_dir, initial_step_count):
+        super().__init__()
         # ENV
         engine = REGISTRY.lookup_engine(args.env)
         env_cls = REGISTRY.lookup_env(args.env)
@@ -109,15 +110,10 @@ class Local(Container):
         step_count = self.initial_step_count
         next_save = self.init_next_save(self.initial_step_count, self.epoch_len)
         prev_step_t = time()
-        ep_rewards = torch.zeros(self.nb_env)
+        reward_counter = RewardCounter(self.nb_env)
 
         obs = dtensor_to_dev(self.env_mgr.reset(), self.device)
-        internals = listd_to_dlist(
-            [
-                self.network.new_internals(self.device)
-                for _ in range(self.nb_env)
-            ]
-        )
+        internals = self.network.new_internals_batched(self.device, self.nb_env)
         start_time = time()
         while step_count < self.nb_step:
             actions, internals = self.agent.act(self.network, obs, internals)
@@ -133,21 +129,18 @@ class Local(Container):
 
             # Perform state updates
             step_count += self.nb_env
-            ep_rewards += rewards.float()
             obs = next_obs
 
-            term_rewards, term_infos = [], []
             for i, terminal in enumerate(terminals):
                 if terminal:
                     for k, v in self.network.new_internals(self.device).items():
                         internals[k][i] = v
-                    term_rewards.append(ep_rewards[i].item())
-                    if infos[i]:
-                        term_infos.append(infos[i])
-                    ep_rewards[i].zero_()
+            term_rewards, term_infos = reward_counter.update_buffers(
+                rewards, terminals, infos
+            )
 
             if term_rewards:
-                term_reward = np.mean(term_rewards)
+                term_reward = sum(term_rewards) / len(term_rewards)
                 delta_t = time() - start_time
                 self.logger.info(
                     "STEP: {} REWARD: {} STEP/S: {}".format(
@@ -33,6 +33,18 @@ class BaseNetwork(torch.nn.Module):
         """
         raise NotImplementedError
 
+    def new_internals_batched(self, device, batch_size):
+        """
+        Initial internals for a batch, built from one new_internals call and
+        one allocation per internal key.
+
+        :return: Dict[InternalKey, List[torch.Tensor (ND)]]
+        """
+        return {
+            k: list(t.expand(batch_size, *t.shape).clone().unbind(0))
+            for k, t in self.new_internals(device).items()
+        }
+
     @abc.abstractmethod
     def forward(self, observation, internals):
         raise NotImplementedError
@@ -42,6 +42,8 @@ Options:
     --end <float>           Epoch to end on [default: -1]
     --seed <int>            Seed for random variables [default: 512]
     --custom-network <str>  Name of custom network class
+    --compile               Capture the eval step in CUDA graphs with
+                            torch.compile (experimental)
 """
 from adept.container import EvalContainer
 from adept.container import Init
@@ -96,6 +98,7 @@ def main(args):
         args.start,
         args.end,
         args.seed,
+        compile_step=bool(args.compile),
     )
     try:
         eval_container.run()
@@ -42,7 +42,7 @@ setup(
         "cloudpickle>=0.5",
         "pyzmq>=17.1.2",
         "docopt>=0.6",
-        "torch>=1.3.1",
+        "torch>=1.10",
         "torchvision>=0.4.2",
         "ray>=0.8.6",
         "pandas>=1.0.5",
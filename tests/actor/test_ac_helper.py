@@ -0,0 +1,43 @@
+import unittest
+
+import torch
+
+from adept.actor.base.ac_helper import ACActorHelperMixin as Helper
+
+
+class TestACActorHelper(unittest.TestCase):
+    def test_sample_action_with_stats_matches_helpers(self):
+        logit = torch.randn(8, 6, generator=torch.Generator().manual_seed(0))
+
+        torch.manual_seed(1)
+        log_softmax = Helper.log_softmax(logit)
+        softmax = Helper.softmax(logit)
+        action = Helper.sample_action(softmax)
+        log_prob = Helper.log_probability(log_softmax, action)
+        entropy = Helper.entropy(log_softmax, softmax)
+
+        torch.manual_seed(1)
+        action_s, log_prob_s, entropy_s = Helper.sample_action_with_stats(
+            logit
+        )
+
+        assert torch.equal(action_s, action)
+        assert log_prob_s.shape == log_prob.shape == (8, 1)
+        assert entropy_s.shape == entropy.shape == (8, 1)
+        assert torch.allclose(log_prob_s, log_prob)
+        assert torch.allclose(entropy_s, entropy)
+
+    def test_sample_action_from_logit_matches_helpers(self):
+        logit = torch.randn(8, 6, generator=torch.Generator().manual_seed(0))
+
+        torch.manual_seed(1)
+        action = Helper.sample_action(Helper.softmax(logit))
+
+        torch.manual_seed(1)
+        action_s = Helper.sample_action_from_logit(logit)
+
+        assert torch.equal(action_s, action)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,81 @@
+import unittest
+
+import torch
+from torch import nn
+
+from adept.container.base.container import Container
+
+
+class StubWriter:
+    def __init__(self):
+        self.scalars = []
+
+    def add_scalar(self, name, value, step_count):
+        self.scalars.append((name, value, step_count))
+
+
+class TestContainer(unittest.TestCase):
+    def test_init_next_save(self):
+        assert Container.init_next_save(0, 100) == 0
+        assert Container.init_next_save(1, 100) == 100
+        assert Container.init_next_save(99, 100) == 100
+        assert Container.init_next_save(100, 100) == 200
+        assert Container.init_next_save(250, 100) == 300
+
+    def test_write_summaries(self):
+        container = Container()
+        writer = StubWriter()
+        net = nn.Linear(2, 1)
+        net.weight.data.copy_(torch.tensor([[3.0, 4.0]]))
+        net.bias.data.fill_(1.0)
+        net(torch.ones(1, 2)).sum().backward()
+
+        container.write_summaries(
+            writer,
+            5,
+            torch.tensor(1.5),
+            {"policy_loss": torch.tensor([0.5])},
+            {"entropy": torch.tensor(2.0)},
+            net.named_parameters(),
+        )
+        names, values, steps = zip(*writer.scalars)
+        assert names == (
+            "loss/total_loss",
+            "loss/policy_loss",
+            "metric/entropy",
+            "weight",
+            "bias",
+            "weight.grad",
+            "bias.grad",
+        )
+        expected = [1.5, 0.5, 2.0, 5.0, 1.0, 2.0 ** 0.5, 1.0]
+        for value, exp in zip(values, expected):
+            self.assertAlmostEqual(value, exp, places=6)
+        assert set(steps) == {5}
+
+    def test_param_norms_every_param_summary_freq(self):
+        container = Container()
+        writer = StubWriter()
+        net = nn.Linear(2, 1)
+        nb_call = 2 * Container.param_summary_freq + 1
+        for step in range(nb_call):
+            container.write_summaries(
+                writer, step, torch.tensor(0.0), {}, {}, net.named_parameters()
+            )
+        param_steps = [s for name, _, s in writer.scalars if name == "weight"]
+        assert param_steps == [0, 10, 20]
+        loss_steps = [
+            s for name, _, s in writer.scalars if name == "loss/total_loss"
+        ]
+        assert loss_steps == list(range(nb_call))
+        # the cadence is tracked per container
+        other = Container()
+        other_writer = StubWriter()
+        other.write_summaries(
+            other_writer, 0, torch.tensor(0.0), {}, {}, net.named_parameters()
+        )
+        assert any(name == "weight" for name, _, _ in other_writer.scalars)
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
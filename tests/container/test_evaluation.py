@@ -0,0 +1,236 @@
+import os
+import tempfile
+import unittest
+
+import numpy as np
+import torch
+from torch import nn
+
+from adept.actor.ac_eval import ACActorEval
+from adept.container.evaluation import EvalContainer
+from adept.network.modular_network import ModularNetwork
+from adept.network.net1d.identity_1d import Identity1D
+from adept.network.net3d.four_conv import FourConv
+from adept.preprocess.base.preprocessor import GPUPreprocessor
+
+
+class StubEnvManager:
+    """
+    Env i gives a reward of i + 1 every step and finishes on step
+    episode_lens[i], then keeps stepping and rewarding.
+    """
+
+    def __init__(self, episode_lens):
+        self.episode_lens = torch.tensor(episode_lens)
+        self.nb_env = len(episode_lens)
+        self.nb_step = 0
+        self.actions = []
+
+    def _obs(self):
+        offsets = torch.arange(self.nb_env, dtype=torch.float32) - 0.5
+        return {"Box": (offsets * (self.nb_step + 1)).unsqueeze(1)}
+
+    def reset(self):
+        self.nb_step = 0
+        return self._obs()
+
+    def step(self, actions):
+        self.actions.append(actions["Discrete"].cpu().clone())
+        self.nb_step += 1
+        rewards = torch.arange(1, self.nb_env + 1, dtype=torch.float32)
+        terminals = self.episode_lens == self.nb_step
+        infos = tuple({} for _ in range(self.nb_env))
+        return self._obs(), rewards, terminals, infos
+
+
+class StubImageEnvManager(StubEnvManager):
+    def _obs(self):
+        generator = torch.Generator().manual_seed(self.nb_step)
+        return {
+            "Box": torch.randn(self.nb_env, 4, 84, 84, generator=generator)
+        }
+
+
+def build_conv_network():
+    return ModularNetwork(
+        {"Box": FourConv((4, 84, 84), "source", "bn")},
+        Identity1D((800,), "body"),
+        {"1": Identity1D((800,), "head")},
+        {"Discrete": (4,), "critic": (1,)},
+        GPUPreprocessor([], {"Box": (4, 84, 84)}),
+    )
+
+
+class StubNetwork(nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = nn.Linear(1, 2)
+
+    def new_internals_batched(self, device, batch_size):
+        return {}
+
+    def forward(self, obs, internals):
+        return {"Discrete": self.linear(obs["Box"])}, internals
+
+
+class StubActor:
+    def __init__(self):
+        self.nb_act = 0
+
+    def act(self, network, obs, internals):
+        self.nb_act += 1
+        preds, internals = network(obs, internals)
+        return {"Discrete": preds["Discrete"].argmax(1)}, {}, internals
+
+
+class StubLogger:
+    def __init__(self):
+        self.warnings = []
+
+    def warning(self, msg):
+        self.warnings.append(msg)
+
+
+def build_container(
+    env_mgr, network, actor=None, device=None, compile_step=False
+):
+    # skip the log dir, registry and subprocess env setup of __init__
+    container = object.__new__(EvalContainer)
+    container.device = device or torch.device("cpu")
+    container.logger = StubLogger()
+    container.compile_step = compile_step
+    container.env_mgr = env_mgr
+    container.actor = actor or StubActor()
+    container.network = network.to(container.device)
+    container._init_eval_state()
+    return container
+
+
+class TestEvalContainer(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.net_path = os.path.join(self.tmp_dir.name, "model.pth")
+        torch.save(StubNetwork().state_dict(), self.net_path)
+        # opposite weights so reloading in place changes the actions
+        self.net_paths = []
+        for sign in (1.0, -1.0):
+            net = StubNetwork()
+            with torch.no_grad():
+                net.linear.weight.copy_(torch.tensor([[sign], [-sign]]))
+                net.linear.bias.zero_()
+            path = os.path.join(self.tmp_dir.name, f"model_{sign}.pth")
+            torch.save(net.state_dict(), path)
+            self.net_paths.append(path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_per_env_totals(self):
+        env_mgr = StubEnvManager([2, 4, 3])
+        container = build_container(env_mgr, StubNetwork())
+        mean, std = container._evaluate(self.net_path)
+
+        # rewards stop counting once each env's episode is done
+        expected = torch.tensor([1.0 * 2, 2.0 * 4, 3.0 * 3])
+        assert container._reward_buf.tolist() == expected.tolist()
+        assert mean == expected.mean().item()
+        assert std == expected.std().item()
+
+    def test_stops_when_all_done(self):
+        env_mgr = StubEnvManager([2, 4, 3])
+        container = build_container(env_mgr, StubNetwork())
+        container._evaluate(self.net_path)
+        assert env_mgr.nb_step == 4
+        assert container.actor.nb_act == 4
+
+    def test_state_resets_between_networks(self):
+        env_mgr = StubEnvManager([1, 2])
+        container = build_container(env_mgr, StubNetwork())
+        first = container._evaluate(self.net_path)
+        second = container._evaluate(self.net_path)
+        assert first == second
+        assert env_mgr.nb_step == 2
+
+    def test_runtime_errors_are_not_swallowed(self):
+        container = build_container(StubEnvManager([1]), StubNetwork())
+
+        def compiled_act(network, obs, internals):
+            raise RuntimeError("size mismatch")
+
+        container._compiled_act = compiled_act
+        with self.assertRaises(RuntimeError):
+            container._evaluate(self.net_path)
+        assert container._compiled_act is compiled_act
+        assert container.logger.warnings == []
+
+    def test_compile_errors_fall_back_to_eager(self):
+        from torch._dynamo.exc import InternalTorchDynamoError
+
+        env_mgr = StubEnvManager([2, 3])
+        container = build_container(env_mgr, StubNetwork())
+
+        def compiled_act(network, obs, internals):
+            raise InternalTorchDynamoError("tracing failed")
+
+        container._compiled_act = compiled_act
+        container._evaluate(self.net_path)
+        assert container._compiled_act is None
+        assert len(container.logger.warnings) == 1
+        assert container._reward_buf.tolist() == [2.0, 6.0]
+
+    def _evaluate_conv_network(self, device):
+        torch.manual_seed(0)
+        net_path = os.path.join(self.tmp_dir.name, "conv.pth")
+        torch.save(build_conv_network().state_dict(), net_path)
+        env_mgr = StubImageEnvManager([2, 3])
+        container = build_container(
+            env_mgr,
+            build_conv_network(),
+            actor=ACActorEval({"Discrete": (4,)}),
+            device=device,
+        )
+        mean, _ = container._evaluate(net_path)
+        assert container._reward_buf.tolist() == [2.0, 6.0]
+        assert mean == 4.0
+        return torch.stack(env_mgr.actions)
+
+    def test_conv_network(self):
+        actions = self._evaluate_conv_network(torch.device("cpu"))
+        assert actions.shape == (3, 2)
+
+    @unittest.skipUnless(torch.cuda.is_available(), "requires CUDA")
+    def test_conv_network_cuda(self):
+        # runs the AMP and pinned obs upload paths set up for CUDA devices
+        actions = self._evaluate_conv_network(torch.device("cuda"))
+        assert actions.shape == (3, 2)
+        assert ((actions >= 0) & (actions < 4)).all()
+
+    @unittest.skipUnless(
+        torch.cuda.is_available() and hasattr(torch, "compile"),
+        "requires CUDA and torch.compile",
+    )
+    def test_compiled_matches_eager(self):
+        device = torch.device("cuda")
+        results = []
+        for compiled in (False, True):
+            env_mgr = StubEnvManager([3, 2, 4])
+            container = build_container(
+                env_mgr, StubNetwork(), device=device, compile_step=compiled
+            )
+            # weights are reloaded into the same parameters between calls
+            for net_path in self.net_paths:
+                container._evaluate(net_path)
+            if compiled:
+                assert container._compiled_act is not None
+                assert container.logger.warnings == []
+            results.append(torch.stack(env_mgr.actions))
+
+        eager, compiled = results
+        assert torch.equal(eager, compiled)
+        # the second checkpoint flips every action
+        nb_step = eager.shape[0] // 2
+        assert torch.equal(eager[:nb_step], 1 - eager[nb_step:])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -0,0 +1,57 @@
+import unittest
+
+import numpy as np
+import torch
+
+from adept.container.base.reward_counter import RewardCounter
+
+
+class TestRewardCounter(unittest.TestCase):
+    def test_accumulates_until_terminal(self):
+        counter = RewardCounter(3)
+        rewards, infos = counter.update_buffers(
+            torch.tensor([1.0, 2.0, 3.0]),
+            torch.tensor([False, False, False]),
+            ({}, {}, {}),
+        )
+        assert rewards == [] and infos == []
+
+        rewards, infos = counter.update_buffers(
+            torch.tensor([1.0, 1.0, 1.0]),
+            torch.tensor([False, True, False]),
+            ({}, {"score": 1.0}, {}),
+        )
+        assert rewards == [3.0]
+        assert infos == [{"score": 1.0}]
+        assert counter.episode_reward_buffer.tolist() == [2.0, 0.0, 4.0]
+
+    def test_empty_infos_are_skipped(self):
+        counter = RewardCounter(2)
+        rewards, infos = counter.update_buffers(
+            torch.tensor([1.0, 2.0]), torch.tensor([True, True]), ({}, {"a": 1})
+        )
+        assert rewards == [1.0, 2.0]
+        assert infos == [{"a": 1}]
+
+    def test_numpy_inputs(self):
+        counter = RewardCounter(2)
+        rewards, _ = counter.update_buffers(
+            np.array([1.5, 2.0]), np.array([False, True]), ({}, {})
+        )
+        assert rewards == [2.0]
+        assert counter.episode_reward_buffer.tolist() == [1.5, 0.0]
+
+    def test_buffer_resets_after_terminal(self):
+        counter = RewardCounter(2)
+        counter.update_buffers(
+            torch.tensor([1.0, 3.0]), torch.tensor([True, False]), ({}, {})
+        )
+        rewards, _ = counter.update_buffers(
+            torch.tensor([5.0, 1.0]), torch.tensor([True, True]), ({}, {})
+        )
+        assert rewards == [5.0, 4.0]
+        assert counter.episode_reward_buffer.tolist() == [0.0, 0.0]
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,7 +1,10 @@
 import unittest
 
+import torch
+
 from adept.network.modular_network import ModularNetwork
 from adept.network.net1d.identity_1d import Identity1D
+from adept.network.net1d.lstm import LSTM
 from adept.network.net2d.identity_2d import Identity2D
 from adept.network.net3d.identity_3d import Identity3D
 from adept.network.net4d.identity_4d import Identity4D
@@ -131,6 +134,23 @@ class TestModularNetwork(unittest.TestCase):
         except:
             self.fail("Unexpected exception")
 
+    def test_new_internals_batched(self):
+        net = ModularNetwork(
+            {"source": Identity1D((16,), "source")},
+            LSTM((16,), "body", False, 8),
+            {"1": Identity1D((8,), "head1d")},
+            {"output": (4,)},
+            dummy_gpu_preprocessor,
+        )
+        internals = net.new_internals_batched("cpu", 3)
+        single = net.new_internals("cpu")
+
+        assert internals.keys() == single.keys()
+        for k, v in internals.items():
+            assert len(v) == 3
+            for t in v:
+                assert torch.equal(t, single[k])
+
 
 if __name__ == "__main__":
     unittest.main(verbosity=1)